@@ -25,9 +25,8 @@ def copilot_usage_glint_sentiment(file_name, survey_close_date, item_options = 5
 # survey_close_date: The date when the survey closed (format: YYYY-MM-DD).
 
     import chardet
-    import re
-    from scipy.stats import percentileofscore
     import datetime
+    import numpy as np
     import pandas as pd
 
 
@@ -57,8 +56,9 @@ def copilot_usage_glint_sentiment(file_name, survey_close_date, item_options = 5
     # CONVERT TO 100PT SCALE FOR EASY FAVORABILITY PARSING
     df_glint['score100'] = (df_glint['Score'] - 1) * (100/(item_options-1))
 
-    # CONVERT TO FAVORABILITY
-    df_glint['favorability'] = df_glint['score100'].apply(lambda x: 'fav' if x > 70 else ('unfav' if x < 40 else 'neu'))
+    # CONVERT TO FAVORABILITY (VECTORIZED BUCKETING INSTEAD OF A PER-ROW APPLY)
+    df_glint['favorability'] = np.select(
+        [df_glint['score100'] > 70, df_glint['score100'] < 40], ['fav', 'unfav'], default='neu')
 
     # DROP NEUTRAL FAVORABILITY
     df_glint = df_glint[df_glint['favorability'] != 'neu']
@@ -164,12 +164,16 @@ def copilot_usage_glint_sentiment(file_name, survey_close_date, item_options = 5
 
     ###### CONVERT TO FAVORABILITY AND BEGIN THE ODDS RATIO CALCULATION #######
 
-    # ADD FAVORABILITY COLUMN
-    df_glint_usage['favorability'] = df_glint_usage['Score'].apply(lambda x: 'fav' if x >= 4 else ('unfav' if x <= 2 else 'neu'))
+    # ADD FAVORABILITY COLUMN (VECTORIZED BUCKETING INSTEAD OF A PER-ROW APPLY)
+    df_glint_usage['favorability'] = np.select(
+        [df_glint_usage['Score'] >= 4, df_glint_usage['Score'] <= 2], ['fav', 'unfav'], default='neu')
     df_glint_usage = df_glint_usage[df_glint_usage['favorability'] != 'neu']
 
+    # ENCODE AS CATEGORICAL SO THE GROUPBY BELOW HASHES INTEGER CODES RATHER THAN STRINGS
+    df_glint_usage['favorability'] = pd.Categorical(df_glint_usage['favorability'])
+
     # GET COUNTS FOR EACH USER CATEGORY GROUPED BY GLINT ITEM AND FAVORABILITY
-    df_glint_usage_grouped = df_glint_usage.groupby(['Glint_Item', 'favorability', 'UserCategory_Group'])['Employee_ID'].nunique().reset_index(name='user_count')
+    df_glint_usage_grouped = df_glint_usage.groupby(['Glint_Item', 'favorability', 'UserCategory_Group'], observed=True)['Employee_ID'].nunique().reset_index(name='user_count')
 
     # ADD 0.5 TO EACH COUNT TO AVOID DIVISION BY ZERO AND INF ODDS
     df_glint_usage_grouped['user_count'] = df_glint_usage_grouped['user_count'] + 0.5
@@ -201,8 +205,13 @@ def copilot_usage_glint_sentiment(file_name, survey_close_date, item_options = 5
     df_glint_usage_grouped_pivot_odds = df_glint_usage_grouped_pivot_odds.drop(columns=['fav', 'unfav'])
 
     # Identify the MAX and MIN odds for each Glint_Item and UserCategory_Group
-    df_glint_usage_grouped_pivot_odds['MAX_MIN'] = df_glint_usage_grouped_pivot_odds.groupby('Glint_Item')['odds'].transform(
-        lambda x: ['MAX' if val == x.max() else 'MIN' if val == x.min() else None for val in x])
+    # (compute each group's max/min once instead of once per element)
+    def label_max_min(x):
+        group_max = x.max()
+        group_min = x.min()
+        return ['MAX' if val == group_max else 'MIN' if val == group_min else None for val in x]
+
+    df_glint_usage_grouped_pivot_odds['MAX_MIN'] = df_glint_usage_grouped_pivot_odds.groupby('Glint_Item')['odds'].transform(label_max_min)
     
     # DROP NONE VALUES FROM MAX_MIN COLUMN
     df_glint_usage_grouped_pivot_odds = df_glint_usage_grouped_pivot_odds.dropna(subset=['MAX_MIN'])
@@ -228,9 +237,12 @@ def copilot_usage_glint_sentiment(file_name, survey_close_date, item_options = 5
     df_glint_usage_grouped_pivot_odds = df_glint_usage_grouped_pivot_odds.merge(df_max_min, on='Glint_Item', how='left')
 
     # Group by 'Glint_Item' and 'odds_ratio', then concatenate 'UserCategory_Group' values into a single string
+    # (the bound '-'.join aggregates directly; the space cleanup runs vectorized over the result)
     df_glint_usage_grouped_pivot_odds_final = df_glint_usage_grouped_pivot_odds.groupby(['Glint_Item', 'odds_ratio']).agg({
-        'UserCategory_Group': lambda x: '-'.join(x).replace(' ', '')
+        'UserCategory_Group': '-'.join
     }).reset_index()
+    df_glint_usage_grouped_pivot_odds_final['UserCategory_Group'] = (
+        df_glint_usage_grouped_pivot_odds_final['UserCategory_Group'].str.replace(' ', '', regex=False))
 
 
 
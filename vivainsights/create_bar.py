@@ -26,10 +26,13 @@ def create_bar_calc(
     stats = False
     ):
     """Calculate the mean of a selected metric, grouped by a selected HR variable."""
-    data = data.groupby(['PersonId',hrvar])        
+    # Encode the HR attribute as categorical so the groupbys below hash integer
+    # codes instead of repeated strings
+    data = data.assign(**{hrvar: data[hrvar].astype('category')})
+    data = data.groupby(['PersonId',hrvar], observed=True)
     data = data[metric].mean()
     data = data.reset_index()
-    output = data.groupby(hrvar).agg(
+    output = data.groupby(hrvar, observed=True).agg(
         metric = (metric, 'mean'),
         n = ('PersonId', 'nunique')
         )
@@ -38,7 +41,7 @@ def create_bar_calc(
     output = output.sort_values(by = 'metric', ascending=False)
     
     if stats == True:
-        stats_df = data.groupby(hrvar).agg(
+        stats_df = data.groupby(hrvar, observed=True).agg(
             sd = (metric, 'std'),
             median = (metric, 'median'),
             min = (metric, 'min'),
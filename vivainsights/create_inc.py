@@ -130,13 +130,15 @@ def create_inc_bar(data: pd.DataFrame, metric: str, hrvar: str, mingroup: int =
     """
 
     # Transform data so that metrics become proportions
-    data_t = data.copy()
     if position == "above":
-        data_t[metric] = data_t[metric] >= threshold
+        metric_inc = data[metric] >= threshold
     elif position == "below":
-        data_t[metric] = data_t[metric] <= threshold
+        metric_inc = data[metric] <= threshold
     else:
         raise ValueError("Please enter a valid input for `position`.")
+
+    # Overwrite the metric with the incidence flag without deep-copying the frame
+    data_t = data.assign(**{metric: metric_inc})
     
     
     title_text = f"Incidence of {metric} {position} {threshold}" # Set title text    
@@ -202,9 +204,13 @@ def create_inc_grid(data: pd.DataFrame, metric: str, hrvar: typing.List, mingrou
     if not isinstance(hrvar, list) or len(hrvar) != 2:
         raise ValueError("`hrvar` must be a list of length 2.")
 
-    metric_to_pass = np.where(data[metric] >= threshold, 1, 0) \
-        if position == "above" else np.where(data[metric] <= threshold, 1, 0) \
-            if position == "below" else {}
+    # A single comparison cast to int replaces the chained np.where dispatch
+    if position == "above":
+        metric_to_pass = (data[metric] >= threshold).astype(int)
+    elif position == "below":
+        metric_to_pass = (data[metric] <= threshold).astype(int)
+    else:
+        raise ValueError("Please enter a valid input for `position`.")
     
     myTable: pd.DataFrame = (
         data
@@ -212,8 +218,7 @@ def create_inc_grid(data: pd.DataFrame, metric: str, hrvar: typing.List, mingrou
         .groupby(hrvar + ['PersonId'], as_index=False)
         .agg({'metric_inc': 'mean'})
         .groupby(hrvar, as_index=False)
-        .agg({'metric_inc': 'mean', 'PersonId': 'nunique'})
-        .rename(columns={'metric_inc': 'incidence', 'PersonId': 'count'})
+        .agg(incidence=('metric_inc', 'mean'), count=('PersonId', 'nunique'))
         .query('count >= @mingroup')
         .sort_values('incidence', ascending=False)
         )
@@ -232,7 +237,9 @@ def create_inc_grid(data: pd.DataFrame, metric: str, hrvar: typing.List, mingrou
         cap_str = extract_date_range(data, return_type = 'text')
         
         # Create the heatmap with the new annot DataFrame
-        myTable['metric_text'] = myTable.apply(lambda row: f"{row['incidence']*100:.1f}% ({row['count']})", axis=1)
+        myTable['metric_text'] = (
+            (myTable['incidence'] * 100).round(1).astype(str) + '% (' + myTable['count'].astype(str) + ')'
+        )
         
         # Order the columns and rows by the longest first to fit landscape plot
         if myTable[hrvar[0]].nunique() > myTable[hrvar[1]].nunique():
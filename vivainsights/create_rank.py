@@ -34,7 +34,12 @@ def create_rank_calc(data: pd.DataFrame,
             ind_df = ind_df[['hrvar', 'attributes', 'metric', 'n']] # reorder the columns     
         
         output_list.append(ind_df) # appending output to the list
-        output = pd.concat(output_list, axis=0) # binding the data together
+
+    # Bind the data together once after the loop; concatenating inside the loop
+    # rebuilds the accumulated frame on every iteration. Empty frames are
+    # skipped so they do not degrade the result dtypes.
+    non_empty = [ind_df for ind_df in output_list if not ind_df.empty]
+    output = pd.concat(non_empty if non_empty else output_list, axis=0)
     output = output[output['n'] >= mingroup] # filtering out groups with less than mingroup
     output = output.sort_values(by = 'metric', ascending=False)
     return output
@@ -48,17 +53,18 @@ def create_rank_viz(data: pd.DataFrame,
     col_highlight = '#fe7f4f'
     col_main = '#1d627e'
     
-    result_list = []
-    for i in hrvar:
-        sum_df = create_rank_calc(data, metric, hrvar, mingroup) # summarised output with columns 'hrvar', 'attributes', 'metric', 'n'
-        sum_df_top = sum_df[sum_df['hrvar'] == i].head(1) # top 1 row of the summarised output matching the hrvar            
-        sum_df_bot = sum_df[sum_df['hrvar'] == i].tail(1) # bottom 1 row of the summarised output matching the hrvar
-        sum_df_top['type'] = 'max'
-        sum_df_bot['type'] = 'min'
-        result_list.append(sum_df_top)
-        result_list.append(sum_df_bot)
-        
-    result = pd.concat(result_list, axis=0)
+    # Summarised output with columns 'hrvar', 'attributes', 'metric', 'n'.
+    # The calculation covers every hrvar at once, so run it once rather than once per loop iteration.
+    sum_df = create_rank_calc(data, metric, hrvar, mingroup)
+
+    # sum_df is sorted by metric in descending order, so within each hrvar the
+    # first row is the max and the last row the min; take both in a single
+    # grouped pass instead of re-scanning sum_df once per hrvar
+    grouped = sum_df.groupby('hrvar', sort=False)
+    sum_df_top = grouped.head(1).assign(type='max') # top 1 row of the summarised output per hrvar
+    sum_df_bot = grouped.tail(1).assign(type='min') # bottom 1 row of the summarised output per hrvar
+
+    result = pd.concat([sum_df_top, sum_df_bot], axis=0)
     result_pivot = result.pivot(index='hrvar', columns='type', values=['attributes','metric'])    
     result_pivot.columns = ["_".join(a) for a in result_pivot.columns.to_flat_index()]   
     result_pivot = result_pivot.reset_index()
@@ -114,20 +114,18 @@ def create_trend_calc(data, metric, hrvar, mingroup, date_column, date_format):
   # Clean metric name
   clean_nm = metric.replace("_", " ")
 
-  # Convert Date to datetime and rename hrvar to group
-  data[date_column] = pd.to_datetime(data[date_column], format=date_format)
+  # Convert Date to datetime and rename hrvar to group, without mutating the caller's frame
+  data = data.assign(**{date_column: pd.to_datetime(data[date_column], format=date_format)})
   data = data.rename(columns={hrvar: "group"})
 
-  # Select relevant columns and group by group
+  # Select relevant columns
   myTable = data[["PersonId", date_column, "group", metric]]
-  myTable = myTable.groupby("group")
 
-  # Calculate employee count and filter by mingroup
-  myTable = myTable.apply(lambda x: x.assign(Employee_Count = x["PersonId"].nunique()))
+  # Calculate employee count in a single vectorized pass and filter by mingroup
+  myTable = myTable.assign(Employee_Count = myTable.groupby("group")["PersonId"].transform("nunique"))
   myTable = myTable[myTable["Employee_Count"] >= mingroup]
 
   # Group by date and group and calculate mean metric and employee count
-  myTable.reset_index(drop = True, inplace = True)
   myTable = myTable.groupby([date_column, "group"]).agg({"Employee_Count": "mean", metric: "mean"}).reset_index()
 
   return myTable
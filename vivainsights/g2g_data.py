@@ -10,20 +10,16 @@ Example
 >>> import vivainsights as vi
 >>> g2g_data = vi.load_g2g_data()
 """
-import pkg_resources
+from importlib import resources
 import pandas as pd
-import os
 
 def load_g2g_data():
-    if(pkg_resources.resource_exists(__name__, 'data/g2g_data.csv')):
-        stream = pkg_resources.resource_stream(__name__, 'data/g2g_data.csv')
-    elif(pkg_resources.resource_exists(__name__, '../data/g2g_data.csv')):
-        stream = pkg_resources.resource_stream(__name__, '../data/g2g_data.csv')
-    else:
-        print('Error: please report issue to repo maintainer')    
-    
+    path = resources.files(__package__).joinpath('data/g2g_data.csv')
+    if not path.is_file():
+        print('Error: please report issue to repo maintainer')
+
     # Address `ResourceWarning unclosed file` issue
-    out = pd.read_csv(stream, encoding='utf-8')
-    stream.close()
-    
-    return out
\ No newline at end of file
+    with path.open('rb') as stream:
+        out = pd.read_csv(stream, encoding='utf-8')
+
+    return out
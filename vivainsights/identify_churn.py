@@ -51,7 +51,7 @@ def identify_churn(data: pd.DataFrame,
   - "data"`: Character vector containing the the `PersonId` of employees who have been identified as churned.
   """
 
-  data[date_column] = pd.to_datetime(data[date_column], format = date_format) # Ensure correct format
+  data = data.assign(**{date_column: pd.to_datetime(data[date_column], format = date_format)}) # Ensure correct format without mutating the caller's frame
 
   unique_dates = data[date_column].unique() # Array of unique dates
 
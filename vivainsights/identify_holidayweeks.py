@@ -77,8 +77,10 @@ def identify_holidayweeks(data: pd.DataFrame, sd = 1, return_type = "text"):
     """
 
     try:
-        # convert `MetricDate` to datetime
-        data['MetricDate'] = pd.to_datetime(data.MetricDate)
+        # convert `MetricDate` to datetime; the explicit format and cache skip
+        # per-element format inference on the repeated weekly dates. Assigning
+        # onto a fresh frame leaves the caller's data untouched.
+        data = data.assign(MetricDate = pd.to_datetime(data.MetricDate, format="%Y-%m-%d", cache=True))
 
         # Calculate the mean and z-score of collaboration hours by date
         Calc = data.dropna(subset=['MetricDate', 'Collaboration_hours']).groupby("MetricDate").agg(mean_collab = ("Collaboration_hours", "mean")).reset_index()
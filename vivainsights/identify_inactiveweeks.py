@@ -44,8 +44,10 @@ def identify_inactiveweeks(data: pd.DataFrame, sd=2, return_type="text"):
     -------
     The function `identify_inactiveweeks` returns different outputs based on the value of the `return_type` parameter.
     """
-    # Z score calculation    
-    data['z_score'] = (data['Collaboration_hours'] - data.groupby('PersonId')['Collaboration_hours'].transform('mean')) / data.groupby('PersonId')['Collaboration_hours'].transform('std')
+    # Z score calculation
+    # Group once and reuse the grouping for both transforms
+    grouped_collab = data.groupby('PersonId')['Collaboration_hours']
+    data['z_score'] = (data['Collaboration_hours'] - grouped_collab.transform('mean')) / grouped_collab.transform('std')
     Calc = data[data["z_score"] <= -sd][["PersonId", "MetricDate", "z_score"]].reset_index(drop=True)
 
     # standard deviations below the mean
@@ -10,9 +10,12 @@ in the file using pandas, cleans the column names by removing spaces and special
 returns the resulting data as a pandas dataframe. If there is an error reading the file, the function prints an error message.
 """
 import pandas as pd
-import re 
+import re
 import os
 
+# Precompiled once so repeated imports do not re-parse the pattern
+_SPECIAL_CHARS = re.compile('[^a-zA-Z0-9,]')
+
 def import_query(x, encoding: str = 'utf-8'):
     """
     Name
@@ -37,27 +40,32 @@ def import_query(x, encoding: str = 'utf-8'):
     """    
     
     # in case '.csv' is not all in lower case, make it lower case
-    if x[-4:].lower() == '.csv':
+    if x.lower().endswith('.csv'):
         in_df = x[:-4] + '.csv'
     else:
         in_df = x
         
+    # Fail early on an invalid path or extension before attempting the read
     if not os.path.isfile(in_df):
         raise ValueError("input file does not exist")
-    
-    elif not in_df.endswith('.csv'):
+
+    if not in_df.endswith('.csv'):
         raise ValueError("the input must be a .csv file")
-    
-    else:
-        try:
-            # Try to read in csv file, if file can not be read, exception is thrown.
-            data = pd.read_csv(x, encoding=encoding, delimiter=',')
-            # Replace mentions of '%' with literal string 'Percent'
-            data.columns = [re.sub('%', 'Percent', c.strip()) for c in data]
-            # Remove leading and trailing spaces
-            # Remove spaces and special characters and replacing them with underscores within column names.
-            data.columns = [re.sub('[^a-zA-Z0-9,]', '_', c.strip()) for c in data]
-            
-            return data
-        except: 
-            raise ValueError('something went wrong when reading the file')
+
+    try:
+        # Try to read in csv file, if file can not be read, exception is thrown.
+        data = pd.read_csv(x, encoding=encoding, delimiter=',')
+    except Exception as exc:
+        raise ValueError('something went wrong when reading the file') from exc
+
+    # Remove leading and trailing spaces, replace mentions of '%' with
+    # the literal string 'Percent', then replace spaces and special
+    # characters with underscores, all via the vectorized Index string
+    # methods and the precompiled pattern.
+    data.columns = (
+        data.columns.str.strip()
+        .str.replace('%', 'Percent', regex=False)
+        .str.replace(_SPECIAL_CHARS, '_', regex=True)
+    )
+
+    return data
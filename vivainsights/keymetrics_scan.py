@@ -201,8 +201,7 @@ def keymetrics_scan(data,
     employee_count = (
         data.groupby(hrvar)['PersonId']
         .nunique()
-        .reset_index()
-        .rename(columns={"PersonId": "Employee_Count"})
+        .reset_index(name="Employee_Count")
     )
 
     summary_table = summary_table.merge(employee_count, on=hrvar)
@@ -226,21 +225,26 @@ def keymetrics_scan(data,
         # Use dynamic scaling factor for figure height
         fig, axes = plt.subplots(num_vars, 1, figsize=(10, plot_row_scaling_factor * num_vars), sharex=True)
 
-        for i, variable in enumerate(variables):
-            custom_cmap = LinearSegmentedColormap.from_list(
+        # Loop invariants: build the colormap once and slice summary_long per
+        # variable via a single grouping instead of re-scanning the full frame
+        # on every iteration
+        custom_cmap = LinearSegmentedColormap.from_list(
             "custom_cmap", [low_color, mid_color, high_color])
+        summary_by_variable = dict(tuple(summary_long.groupby('variable', sort=False)))
+
+        for i, variable in enumerate(variables):
             ax = axes[i] if num_vars > 1 else axes
-            subset = summary_long[summary_long['variable'] == variable]
-            row_min = subset['value'].min()
-            row_max = subset['value'].max()
+            subset = summary_by_variable[variable]
+            values = subset['value'].to_numpy()
 
-            # Normalize the values for this row
-            normalized_values = (subset['value'] - row_min) / (row_max - row_min)
-            heatmap_data = pd.DataFrame([normalized_values.values], columns=hrvar_categories)
+            # Normalize the values for this row: np.ptp covers the min/max
+            # spread in a single pass over the ndarray
+            normalized_values = (values - values.min()) / np.ptp(values)
+            heatmap_data = pd.DataFrame([normalized_values], columns=hrvar_categories)
 
             # Create heatmap for this row
             sns.heatmap(heatmap_data,
-                        annot=subset['value'].values.reshape(1, -1),
+                        annot=values.reshape(1, -1),
                         fmt=".1f",
                         cmap=custom_cmap,
                         cbar=False,
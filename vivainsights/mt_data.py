@@ -6,17 +6,16 @@
 This module returns a data frame containing a meeting query.
 """
 
-import pkg_resources
+from importlib import resources
 import pandas as pd
 
 def load_mt_data():
-    # This is a stream-like object. If you want the actual info, call
-    # stream.read()
-    # stream = pkg_resources.resource_string('vivainsights', 'data/mt_data.csv')
-    if(pkg_resources.resource_exists(__name__, 'data/mt_data.csv')):
-        stream = pkg_resources.resource_stream(__name__, 'data/mt_data.csv')
-    elif(pkg_resources.resource_exists(__name__, '../data/mt_data.csv')):
-        stream = pkg_resources.resource_stream(__name__, '../data/mt_data.csv')
-    else:
-        print('Error: please report issue to repo maintainer')    
-    return pd.read_csv(stream, encoding='utf-8')
\ No newline at end of file
+    path = resources.files(__package__).joinpath('data/mt_data.csv')
+    if not path.is_file():
+        print('Error: please report issue to repo maintainer')
+
+    # Address `ResourceWarning unclosed file` issue
+    with path.open('rb') as stream:
+        out = pd.read_csv(stream, encoding='utf-8')
+
+    return out
@@ -359,8 +359,9 @@ def network_p2p(data,
                 plt.rcParams["figure.facecolor"] = bg_fill
                 layout_func = getattr(ig.Graph, f"layout_{layout}")
                 
-                # Get the unique values of the vertex attribute
-                unique_values = list(set(g.vs[v_attr]))
+                # Get the unique values of the vertex attribute, preserving
+                # first-appearance order so colours are assigned deterministically
+                unique_values = list(dict.fromkeys(g.vs[v_attr]))
                 
                 # Create a colormap with one color for each unique value
                 cmap = mcolors.ListedColormap([plt.get_cmap('tab20')(i) for i in range(len(unique_values))])
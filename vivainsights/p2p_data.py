@@ -5,20 +5,16 @@
 """
 This module returns a data frame containing a person-to-person query.
 """
-import pkg_resources
+from importlib import resources
 import pandas as pd
-import os
 
 def load_p2p_data():
-    if(pkg_resources.resource_exists(__name__, 'data/p2p_data.csv')):
-        stream = pkg_resources.resource_stream(__name__, 'data/p2p_data.csv')
-    elif(pkg_resources.resource_exists(__name__, '../data/p2p_data.csv')):
-        stream = pkg_resources.resource_stream(__name__, '../data/p2p_data.csv')
-    else:
-        print('Error: please report issue to repo maintainer')    
-    
+    path = resources.files(__package__).joinpath('data/p2p_data.csv')
+    if not path.is_file():
+        print('Error: please report issue to repo maintainer')
+
     # Address `ResourceWarning unclosed file` issue
-    out = pd.read_csv(stream, encoding='utf-8')
-    stream.close()
-    
-    return out
\ No newline at end of file
+    with path.open('rb') as stream:
+        out = pd.read_csv(stream, encoding='utf-8')
+
+    return out
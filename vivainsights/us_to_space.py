@@ -5,15 +5,25 @@
 """
 Description
 -----------
-The function replaces underscores with spaces in a given string.
+The function replaces underscores with spaces in a given string or collection of strings.
 
-:param string: A string that may contain underscores that need to be replaced with spaces
-:return: The function `us_to_space` takes a string as input and replaces all underscores with spaces
-using the `replace` method. It then returns the modified string with spaces instead of underscores.
+:param string: A string, or an array-like of strings (list, tuple, numpy array, pandas
+    Series/Index), that may contain underscores that need to be replaced with spaces
+:return: The modified input with spaces instead of underscores. Pandas inputs are replaced
+    through the vectorized `.str.replace` method and keep their type; lists, tuples and
+    numpy arrays are returned as lists; plain strings are returned as strings.
 
 Examples
 --------
 >>> us_to_space("Meeting_and_call_hours_with_manager_1_1")
+>>> us_to_space(["Collaboration_hours", "Email_hours"])
 """
+import numpy as np
+import pandas as pd
+
 def us_to_space(string):
-    return string.replace("_", " ")
\ No newline at end of file
+    if isinstance(string, (pd.Series, pd.Index)):
+        return string.str.replace("_", " ", regex=False)
+    if isinstance(string, (list, tuple, np.ndarray)):
+        return [s.replace("_", " ") for s in string]
+    return string.replace("_", " ")